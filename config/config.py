@@ -5,9 +5,16 @@ URL (str): The base URL of the application under test. Default is the Twitch mob
 REQUEST_TIMEOUT (int): The time to wait until raise an error in request.
 LOG_LEVEL (str): The level of logging to be used (e.g., DEBUG, INFO). Default is "DEBUG".
 LOG_NAME (str): The name of the log file.
+PIPELINE_CHUNK_SIZE (int): The number of raw payloads sent to a worker process at once.
+PIPELINE_FETCH_WORKERS (int): The number of threads used to fetch facts concurrently.
+PIPELINE_MAX_PENDING_CHUNKS (int): The number of chunks allowed in flight before the pipeline
+                                   stops pulling new input.
 """
 
 URI = "https://cat-fact.herokuapp.com"
 REQUEST_TIMEOUT = 10
 LOG_LEVEL = "DEBUG"
 LOG_NAME = "log_file.log"
+PIPELINE_CHUNK_SIZE = 64
+PIPELINE_FETCH_WORKERS = 8
+PIPELINE_MAX_PENDING_CHUNKS = 4
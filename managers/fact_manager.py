@@ -69,6 +69,26 @@ class FactManager:
         self.logger.error("Invalid response format for random fact")
         raise ValueError("Invalid response")
 
+    def get_raw_fact_by_id(self, fact_id: str) -> bytes:
+        """
+        Fetches the raw JSON body of a fact by its ID, leaving validation to the caller.
+
+        Args:
+            fact_id (str): The ID of the fact to fetch.
+
+        Returns:
+            bytes: The raw response body.
+
+        Raises:
+            ValueError: If the response status code is not 200.
+        """
+        self.logger.debug(f"Fetching raw fact by ID: {fact_id}")
+        response = self.requester.get(f"/facts/{fact_id}")
+        if response.status_code == 200:
+            return response.content
+        self.logger.error(f"Unexpected status code {response.status_code} for fact ID: {fact_id}")
+        raise ValueError(f"Invalid response for fact ID: {fact_id}")
+
     def get_fact_by_id(self, fact_id: str) -> FactResponse:
         """
         Fetches a fact by its ID from the API.
@@ -0,0 +1,320 @@
+"""
+This module contains the FactPipeline class, which spreads fact processing across CPU cores.
+Facts are fetched concurrently with threads through a FactManager, while JSON decoding, Pydantic
+validation and optional transforms run in a process pool.
+"""
+
+import json
+import multiprocessing
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, \
+    ThreadPoolExecutor, wait
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel, ValidationError
+
+from config import config
+from managers.fact_manager import FactManager
+from models.fact.response.fact_response import FactResponse
+from utilities.logger import Logger
+
+logger = Logger(__name__)
+
+Payload = Tuple[str, bytes]
+Transform = Callable[[BaseModel], Any]
+
+# Workers are never forked from the parent, which may be running fetch threads.
+_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+_HAS_MODEL_DUMP = hasattr(BaseModel, "model_dump")
+
+
+def _pack_chunks(payloads: Iterable[Payload], chunk_size: int) -> Iterator[List[Payload]]:
+    """
+    Groups labelled payloads into chunks sent to a worker process at once. The response bytes
+    are pickled as they are, without being decoded or re-encoded in the parent.
+
+    Args:
+        payloads (Iterable[Payload]): The labelled raw JSON payloads to group.
+        chunk_size (int): The maximum number of payloads per chunk.
+
+    Yields:
+        List[Payload]: A chunk of labelled payloads.
+    """
+    chunk: List[Payload] = []
+    for payload in payloads:
+        chunk.append(payload)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _process_chunk(chunk: List[Payload], model: Type[BaseModel],
+                   transform: Optional[Transform]) -> List[Any]:
+    """
+    Decodes, validates and transforms every payload of a chunk. Runs inside a worker process.
+
+    Args:
+        chunk (List[Payload]): The labelled raw JSON payloads.
+        model (Type[BaseModel]): The Pydantic model class to validate each record against.
+        transform (Optional[Transform]): Optional picklable callable applied to each record.
+
+    Returns:
+        List[Any]: The processed records, in the same order as the payloads in the chunk.
+
+    Raises:
+        ValueError: If a payload is not valid JSON or does not match the model.
+    """
+    records = []
+    for label, payload in chunk:
+        records.extend(_process_payload(label, payload, model, transform))
+    return records
+
+
+def _process_payload(label: str, payload: bytes, model: Type[BaseModel],
+                     transform: Optional[Transform]) -> List[Any]:
+    """
+    Decodes, validates and transforms a single payload. A payload holding a JSON list
+    produces one record per item.
+
+    Models are not sent back to the parent process, because unpickling them there costs about
+    as much as validating them. Without a transform, each record is returned as a plain dict
+    keyed by field name (`id`, `v`), not by API alias (`_id`, `__v`).
+
+    Args:
+        label (str): The payload description used in error messages.
+        payload (bytes): The raw JSON payload.
+        model (Type[BaseModel]): The Pydantic model class to validate each record against.
+        transform (Optional[Transform]): Optional picklable callable applied to each record.
+
+    Returns:
+        List[Any]: The processed records.
+
+    Raises:
+        ValueError: If the payload is not valid JSON or does not match the model.
+    """
+    try:
+        data = json.loads(payload)
+    except ValueError as e:
+        logger.error(f"JSON decode error for {label}: {e}")
+        raise ValueError(f"Invalid response for {label}") from e
+    items = data if isinstance(data, list) else [data]
+    if not all(isinstance(item, dict) for item in items):
+        logger.error(f"Expected a JSON object or a list of objects for {label}")
+        raise ValueError(f"Invalid response for {label}")
+    try:
+        records = [model(**item) for item in items]
+    except ValidationError as e:
+        logger.error(f"Pydantic validation error for {label}: {e}")
+        raise ValueError(f"Invalid response for {label}") from e
+    if transform is None:
+        return [_dump_record(record) for record in records]
+    return [transform(record) for record in records]
+
+
+def _dump_record(record: BaseModel) -> dict:
+    """
+    Converts a record to a dict keyed by field name, with `model_dump` on Pydantic 2 and
+    `dict` on Pydantic 1.
+
+    Args:
+        record (BaseModel): The validated record.
+
+    Returns:
+        dict: The record fields.
+    """
+    if _HAS_MODEL_DUMP:
+        return record.model_dump()
+    return record.dict()
+
+
+def _bounded_map(executor: Executor, func: Callable[[Any], Any], items: Iterable[Any],
+                 max_pending: int, ordered: bool) -> Iterator[Any]:
+    """
+    Lazily maps a function over items with an executor, keeping at most `max_pending`
+    futures in flight. Input is only pulled when a slot is free, which gives backpressure.
+    Closing the generator cancels the futures that have not started yet.
+
+    Args:
+        executor (Executor): The executor that runs the function.
+        func (Callable[[Any], Any]): The function to apply to each item.
+        items (Iterable[Any]): The items to process.
+        max_pending (int): The maximum number of submitted but unconsumed futures.
+        ordered (bool): Whether results are yielded in input order or as they complete.
+
+    Yields:
+        Any: The result of the function for each item.
+    """
+    pending: Union[deque, set] = deque() if ordered else set()
+    try:
+        for item in items:
+            if len(pending) >= max_pending:
+                yield _pop_result(pending)
+            future = executor.submit(func, item)
+            if ordered:
+                pending.append(future)
+            else:
+                pending.add(future)
+        while pending:
+            yield _pop_result(pending)
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _pop_result(pending: Union[deque, set]) -> Any:
+    """
+    Removes the next future from the pending collection and returns its result. A deque is
+    consumed in submission order, a set in completion order.
+
+    Args:
+        pending (Union[deque, set]): The in-flight futures.
+
+    Returns:
+        Any: The result of the removed future.
+    """
+    if isinstance(pending, deque):
+        future: Future = pending.popleft()
+    else:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        future = done.pop()
+        pending.discard(future)
+    return future.result()
+
+
+# The attributes are the pipeline settings, kept flat like the constructor arguments.
+class FactPipeline:  # pylint: disable=R0902
+    """
+    Processes facts in parallel stages around a FactManager.
+    """
+
+    # The settings are independent tuning knobs, passed as keyword-only arguments.
+    # pylint: disable=R0913
+    def __init__(self, fact_manager: FactManager, *,
+                 model: Type[BaseModel] = FactResponse,
+                 transform: Optional[Transform] = None,
+                 chunk_size: int = config.PIPELINE_CHUNK_SIZE,
+                 fetch_workers: int = config.PIPELINE_FETCH_WORKERS,
+                 process_workers: Optional[int] = None,
+                 max_pending: int = config.PIPELINE_MAX_PENDING_CHUNKS,
+                 ordered: bool = True) -> None:
+        """
+        Args:
+            fact_manager (FactManager): The manager used to fetch facts.
+            model (Type[BaseModel]): The Pydantic model each record is validated against.
+                                     Defaults to FactResponse.
+            transform (Optional[Transform]): Optional callable applied to each validated record
+                                             in the worker process. It must be picklable
+                                             (e.g. a module-level function) and should return
+                                             something cheap to pickle. Without it, records are
+                                             yielded as dicts keyed by field name.
+            chunk_size (int): The number of payloads sent to a worker process at once.
+            fetch_workers (int): The number of threads used to fetch facts.
+            process_workers (Optional[int]): The number of worker processes. Defaults to the
+                                             number of CPUs.
+            max_pending (int): The number of chunks allowed in flight at once.
+            ordered (bool): Whether records are yielded in input order. Unordered output
+                            yields each chunk as soon as it is processed.
+
+        Raises:
+            ValueError: If chunk_size, fetch_workers, process_workers or max_pending is
+                        not positive.
+        """
+        if chunk_size < 1 or fetch_workers < 1 or max_pending < 1 or \
+                (process_workers is not None and process_workers < 1):
+            raise ValueError(
+                "chunk_size, fetch_workers, process_workers and max_pending must be positive")
+        self.fact_manager = fact_manager
+        self.model = model
+        self.transform = transform
+        self.chunk_size = chunk_size
+        self.fetch_workers = fetch_workers
+        self.process_workers = process_workers
+        self.max_pending = max_pending
+        self.ordered = ordered
+
+    def process_fact_ids(self, fact_ids: Iterable[str]) -> Iterator[Any]:
+        """
+        Fetches facts by ID concurrently and processes them in worker processes.
+
+        Args:
+            fact_ids (Iterable[str]): The IDs of the facts to fetch.
+
+        Yields:
+            Any: The validated records as dicts keyed by field name, or the results of
+                 the transform.
+
+        Raises:
+            ValueError: If a response is invalid.
+        """
+        logger.info("Processing facts by ID")
+        with ThreadPoolExecutor(max_workers=self.fetch_workers) as executor:
+            payloads = _bounded_map(executor, self._fetch_fact, fact_ids,
+                                    self.max_pending * self.chunk_size, self.ordered)
+            records = self._process(payloads)
+            try:
+                # A plain loop, so the finally block runs before `records` is closed.
+                for record in records:  # pylint: disable=R1737
+                    yield record
+            finally:
+                # Cancel the queued fetches before waiting on the process pool.
+                payloads.close()
+                records.close()
+
+    def process_payloads(self, payloads: Iterable[bytes]) -> Iterator[Any]:
+        """
+        Processes raw JSON payloads in worker processes. A payload may hold a single fact or
+        a list of facts.
+
+        Args:
+            payloads (Iterable[bytes]): The raw JSON payloads, e.g. `response.content`.
+
+        Yields:
+            Any: The validated records as dicts keyed by field name, or the results of
+                 the transform.
+
+        Raises:
+            ValueError: If a payload is invalid.
+        """
+        labelled = ((f"payload {index}", payload) for index, payload in enumerate(payloads))
+        yield from self._process(labelled)
+
+    def _process(self, payloads: Iterable[Payload]) -> Iterator[Any]:
+        """
+        Sends labelled payloads to the process pool in chunks and yields the records.
+
+        Args:
+            payloads (Iterable[Payload]): The labelled raw JSON payloads.
+
+        Yields:
+            Any: The validated records as dicts, or the results of the transform.
+        """
+        count = 0
+        with ProcessPoolExecutor(max_workers=self.process_workers,
+                                 mp_context=_MP_CONTEXT) as executor:
+            worker = partial(_process_chunk, model=self.model, transform=self.transform)
+            results = _bounded_map(executor, worker, _pack_chunks(payloads, self.chunk_size),
+                                   self.max_pending, self.ordered)
+            try:
+                for records in results:
+                    count += len(records)
+                    yield from records
+            finally:
+                results.close()
+        logger.info(f"Processed {count} records")
+
+    def _fetch_fact(self, fact_id: str) -> Payload:
+        """
+        Fetches the raw payload of a fact by its ID through the FactManager.
+
+        Args:
+            fact_id (str): The ID of the fact to fetch.
+
+        Returns:
+            Payload: The payload label and the raw response body.
+        """
+        return f"fact ID {fact_id}", self.fact_manager.get_raw_fact_by_id(fact_id)
@@ -1,11 +1,13 @@
 """
-This module contains a pytest fixture for initializing the FactManager with 
-an APIRequester and a Logger.
+This module contains pytest fixtures for initializing the FactManager with 
+an APIRequester and a Logger, and the FactPipeline around it.
 """
 
 import pytest
 from managers.fact_manager import FactManager
+from managers.fact_pipeline import FactPipeline
 from managers.api_requester import APIRequester
+from models.fact.fact import Fact
 from utilities.logger import Logger
 
 logger = Logger(__name__)
@@ -23,3 +25,19 @@ def fact_manager():
     fact_manager_instance = FactManager(api_requester)
     logger.info("FactManager initialized successfully.")
     return fact_manager_instance
+
+
+# pytest injects the fact_manager fixture by argument name.
+@pytest.fixture(scope="function")
+def fact_pipeline(fact_manager):  # pylint: disable=W0621
+    """
+    This fixture sets up the FactPipeline around the FactManager fixture.
+
+    Args:
+        fact_manager (FactManager): The FactManager instance provided by pytest fixtures.
+
+    Returns:
+        FactPipeline: An instance of FactPipeline with small chunks for testing.
+    """
+    logger.info("Initializing FactPipeline with FactManager.")
+    return FactPipeline(fact_manager, model=Fact, chunk_size=2, process_workers=2)
@@ -0,0 +1,291 @@
+# pylint: disable=R0903
+"""
+This module contains test cases for the FactPipeline class.
+"""
+
+import json
+import time
+
+from types import SimpleNamespace
+from typing import Iterator, List, Optional
+
+import pytest
+import allure
+
+from managers.fact_manager import FactManager
+from managers.fact_pipeline import FactPipeline
+from managers.requester import Requester
+from models.fact.fact import Fact
+from utilities.logger import Logger
+
+CHUNK_SIZE = 2
+MAX_PENDING = 2
+# Payloads buffered by the process stage plus fetches in flight, before the first record.
+PULL_LIMIT = (MAX_PENDING + 1) * CHUNK_SIZE + MAX_PENDING * CHUNK_SIZE + 1
+
+
+def build_payload(fact_id: str) -> bytes:
+    """
+    Builds a raw JSON payload for a fact.
+
+    Args:
+        fact_id (str): The ID of the fact, also used in its text.
+
+    Returns:
+        bytes: The encoded fact payload.
+    """
+    return json.dumps({
+        "_id": fact_id,
+        "user": "user-1",
+        "text": f"Fact {fact_id}",
+        "type": "cat",
+        "deleted": False,
+        "createdAt": "2018-01-04T01:10:54.673Z",
+        "updatedAt": "2020-08-23T20:20:01.611Z",
+        "__v": 0,
+        "status": {"verified": True, "sentCount": 1},
+    }).encode()
+
+
+def upper_text(fact: Fact) -> str:
+    """
+    Transform used by the tests; it must be module-level to be picklable.
+
+    Args:
+        fact (Fact): The validated fact.
+
+    Returns:
+        str: The fact text in upper case.
+    """
+    return fact.text.upper()
+
+
+class StubRequester(Requester):
+    """
+    Offline requester that serves facts built by `build_payload` and records each request.
+    """
+
+    def __init__(self, delay: float = 0.0, missing_ids: Optional[List[str]] = None) -> None:
+        self.delay = delay
+        self.missing_ids = missing_ids or []
+        self.endpoints: List[str] = []
+
+    def get(self, endpoint: str, params: Optional[dict] = None) -> SimpleNamespace:
+        """
+        Returns the fact of the requested ID, or a 404 response for missing IDs.
+
+        Args:
+            endpoint (str): The requested endpoint, ending with the fact ID.
+            params (Optional[dict]): Ignored.
+
+        Returns:
+            SimpleNamespace: An object with the `status_code` and `content` of the response.
+        """
+        self.endpoints.append(endpoint)
+        time.sleep(self.delay)
+        fact_id = endpoint.rsplit("/", 1)[-1]
+        if fact_id in self.missing_ids:
+            return SimpleNamespace(status_code=404, content=b'{"message": "Not found"}')
+        return SimpleNamespace(status_code=200, content=build_payload(fact_id))
+
+    def post(self, endpoint: str, data: Optional[dict] = None) -> SimpleNamespace:
+        """
+        Not used by the pipeline.
+        """
+        raise NotImplementedError
+
+
+class CountingIds:
+    """
+    Iterable of fact IDs that counts how many have been pulled.
+    """
+
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.pulled = 0
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self.total):
+            self.pulled += 1
+            yield f"fact-{index}"
+
+
+def build_pipeline(requester: StubRequester, **options) -> FactPipeline:
+    """
+    Builds a FactPipeline with small chunks around a FactManager using the given requester.
+
+    Args:
+        requester (StubRequester): The requester used by the FactManager.
+        **options: Extra FactPipeline options.
+
+    Returns:
+        FactPipeline: The pipeline under test.
+    """
+    options.setdefault("fetch_workers", 2)
+    options.setdefault("max_pending", MAX_PENDING)
+    options.setdefault("chunk_size", CHUNK_SIZE)
+    return FactPipeline(FactManager(requester), model=Fact, process_workers=2, **options)
+
+
+@allure.feature("Fact Pipeline")
+@pytest.mark.usefixtures("fact_pipeline")
+class TestFactPipeline:
+    """
+    Test suite for the FactPipeline class.
+    """
+
+    fact_pipeline: FactPipeline = None
+    logger = Logger(__name__)
+
+    @pytest.fixture(autouse=True)
+    def setup(self, fact_pipeline) -> None:
+        """
+        Fixture to set up the FactPipeline instance for each test.
+
+        Args:
+            fact_pipeline (FactPipeline): The FactPipeline instance provided by pytest fixtures.
+        """
+        self.fact_pipeline = fact_pipeline
+
+    @allure.title("Process Payloads in Order")
+    def test_process_payloads_ordered(self):
+        """
+        Test case to verify that payloads are validated and yielded in input order.
+
+        Raises:
+            AssertionError: If a record is missing or out of order.
+        """
+        self.logger.info("Starting test_process_payloads_ordered")
+        payloads = [build_payload(f"fact-{index}") for index in range(7)]
+        facts = list(self.fact_pipeline.process_payloads(payloads))
+        assert len(facts) == 7, f"Expected 7 facts, but got: {len(facts)}"
+        for index, fact in enumerate(facts):
+            assert fact["id"] == f"fact-{index}", \
+                f"Expected ID: fact-{index}, but got: {fact['id']}"
+        self.logger.info("Successfully processed payloads in order")
+
+    @allure.title("Process Payloads Unordered with Transform")
+    def test_process_payloads_unordered_with_transform(self):
+        """
+        Test case to verify that the transform runs on every record and list payloads
+        are flattened in unordered mode.
+
+        Raises:
+            AssertionError: If the transformed records do not match expectations.
+        """
+        self.logger.info("Starting test_process_payloads_unordered_with_transform")
+        self.fact_pipeline.transform = upper_text
+        self.fact_pipeline.ordered = False
+        payloads = [build_payload(f"fact-{index}") for index in range(4)]
+        payloads.append(b"[" + build_payload("fact-4") + b"," + build_payload("fact-5") + b"]")
+        texts = set(self.fact_pipeline.process_payloads(payloads))
+        expected = {f"FACT FACT-{index}" for index in range(6)}
+        assert texts == expected, f"Expected texts: {expected}, but got: {texts}"
+        self.logger.info("Successfully processed payloads with transform")
+
+    @allure.title("Invalid Payload Raises Error")
+    @pytest.mark.parametrize("invalid_payload",
+                             [b'{"_id": "missing-fields"}', b"not json", b"null", b"[1]", b'"x"'])
+    def test_process_payloads_invalid(self, invalid_payload):
+        """
+        Test case to confirm that an invalid payload raises a ValueError naming the payload.
+
+        Args:
+            invalid_payload (bytes): A payload that is not a valid fact.
+
+        Raises:
+            AssertionError: If no ValueError is raised.
+        """
+        self.logger.info(f"Starting test_process_payloads_invalid with: {invalid_payload}")
+        payloads = [build_payload("fact-0"), invalid_payload]
+        with pytest.raises(ValueError, match="Invalid response for payload 1"):
+            list(self.fact_pipeline.process_payloads(payloads))
+        self.logger.info("Invalid payload raised ValueError")
+
+    @allure.title("Process Fact IDs in Order")
+    def test_process_fact_ids_ordered(self):
+        """
+        Test case to verify that concurrently fetched facts are yielded in input order.
+
+        Raises:
+            AssertionError: If a fact is missing or out of order.
+        """
+        self.logger.info("Starting test_process_fact_ids_ordered")
+        requester = StubRequester(delay=0.01)
+        fact_ids = [f"fact-{index}" for index in range(15)]
+        facts = list(build_pipeline(requester).process_fact_ids(fact_ids))
+        assert [fact["id"] for fact in facts] == fact_ids, "Expected facts in input order"
+        assert len(requester.endpoints) == 15, \
+            f"Expected 15 requests, but got: {len(requester.endpoints)}"
+        self.logger.info("Successfully processed fact IDs in order")
+
+    @allure.title("Fact IDs Are Pulled Lazily")
+    def test_process_fact_ids_backpressure(self):
+        """
+        Test case to verify that only a bounded number of IDs is pulled before the first record.
+
+        Raises:
+            AssertionError: If more IDs than the in-flight limit are pulled.
+        """
+        self.logger.info("Starting test_process_fact_ids_backpressure")
+        fact_ids = CountingIds(1000)
+        records = build_pipeline(StubRequester()).process_fact_ids(fact_ids)
+        next(records)
+        assert fact_ids.pulled <= PULL_LIMIT, \
+            f"Expected at most {PULL_LIMIT} IDs pulled, but got: {fact_ids.pulled}"
+        records.close()
+        self.logger.info("IDs were pulled lazily")
+
+    @allure.title("Closing the Pipeline Cancels Queued Fetches")
+    def test_process_fact_ids_close_cancels_fetches(self):
+        """
+        Test case to verify that closing the pipeline early does not run the queued fetches.
+
+        Raises:
+            AssertionError: If queued fetches still run after the pipeline is closed.
+        """
+        self.logger.info("Starting test_process_fact_ids_close_cancels_fetches")
+        requester = StubRequester(delay=0.05)
+        records = build_pipeline(requester, chunk_size=8).process_fact_ids(CountingIds(1000))
+        next(records)
+        requested = len(requester.endpoints)
+        records.close()
+        late_requests = len(requester.endpoints) - requested
+        assert late_requests <= 2, \
+            f"Expected at most the 2 running fetches, but got {late_requests} more requests"
+        self.logger.info("Queued fetches were cancelled")
+
+    @allure.title("Missing Fact Raises Error")
+    def test_process_fact_ids_missing(self):
+        """
+        Test case to confirm that a non-200 response raises a ValueError naming the fact ID
+        and stops fetching.
+
+        Raises:
+            AssertionError: If no ValueError is raised or fetching does not stop.
+        """
+        self.logger.info("Starting test_process_fact_ids_missing")
+        requester = StubRequester(missing_ids=["fact-3"])
+        with pytest.raises(ValueError, match="fact-3"):
+            list(build_pipeline(requester).process_fact_ids(CountingIds(1000)))
+        assert len(requester.endpoints) <= PULL_LIMIT, \
+            f"Expected fetching to stop, but got {len(requester.endpoints)} requests"
+        self.logger.info("Missing fact raised ValueError")
+
+    @allure.title("Invalid Settings Raise Error")
+    @pytest.mark.parametrize("option", ["chunk_size", "fetch_workers", "process_workers",
+                                        "max_pending"])
+    def test_invalid_settings(self, option):
+        """
+        Test case to confirm that a non-positive setting is rejected when the pipeline is built.
+
+        Args:
+            option (str): The name of the setting set to zero.
+
+        Raises:
+            AssertionError: If no ValueError is raised.
+        """
+        self.logger.info(f"Starting test_invalid_settings with: {option}")
+        with pytest.raises(ValueError, match="must be positive"):
+            FactPipeline(self.fact_pipeline.fact_manager, **{option: 0})
+        self.logger.info("Invalid setting raised ValueError")